@@ -246,8 +246,7 @@ def has_ferry_in_route(origin, destination):
         directions = gmaps.directions(
             origin_str,
             dest_str,
-            mode='driving',
-            departure_time=datetime.now()
+            mode='driving'
         )
 
         if directions:
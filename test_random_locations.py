@@ -4,23 +4,43 @@ Generates 100 random points following the same criteria as the app,
 plots them on a map, and saves as PNG.
 """
 
+import asyncio
+import atexit
+import functools
 import googlemaps
-import random
-import math
+import json
 import os
-from datetime import datetime
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 import folium
+from folium.plugins import FastMarkerCluster
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    import time
-    SELENIUM_AVAILABLE = True
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
-    print("Note: Selenium not available, will use matplotlib for PNG export")
+    PLAYWRIGHT_AVAILABLE = False
+    print("Note: Playwright not available, will use matplotlib for PNG export")
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    print("Note: diskcache not available, Google Maps results won't be cached between runs")
+try:
+    from shapely.geometry import Point, shape
+    from shapely.ops import unary_union
+    from shapely.prepared import prep
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+    print("Note: shapely not available, every water check will use the Google Maps API")
 
 # Load environment variables
 load_dotenv()
@@ -30,7 +50,30 @@ API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 if not API_KEY:
     raise ValueError("GOOGLE_MAPS_API_KEY not found in environment variables")
 
-gmaps = googlemaps.Client(key=API_KEY)
+# Rate limits are retried by with_retry() below rather than inside the client.
+# The client still retries HTTP 500/503/504 itself until its retry_timeout.
+gmaps = googlemaps.Client(key=API_KEY, retry_over_query_limit=False)
+
+# Retry settings for rate limited (429 / OVER_QUERY_LIMIT) responses and
+# the server errors the client doesn't already retry
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+RETRIABLE_HTTP_STATUSES = {429, 502}
+
+# Shared request budget across all worker threads
+RATE_LIMIT_PER_SECOND = 50
+RATE_LIMIT_BURST = 100
+
+# On-disk cache of Google Maps check results, reused across runs
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.gmaps_cache')
+CACHE_EXPIRE_SECONDS = 30 * 86400  # 30 days
+gmaps_cache = diskcache.Cache(CACHE_DIR) if DISKCACHE_AVAILABLE else None
+
+# In-memory cache size for check results within a single run
+MEMORY_CACHE_SIZE = 4096
+
+# Water check result for every snapped location checked this run
+VERIFIED = {}
 
 # Toronto Union Station coordinates
 UNION_STATION = {
@@ -42,142 +85,411 @@ UNION_STATION = {
 MAX_RADIUS_KM = 10
 MAX_RADIUS_METERS = MAX_RADIUS_KM * 1000
 
+# Coarse, hand-traced outline of the land around Union Station (mainland and islands)
+LAND_GEOJSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'toronto_land.geojson')
+
+# Points this close to the outline are too close to call locally (~500m)
+SHORELINE_MARGIN_DEGREES = 0.005
+
+# Headless browser for HTML map screenshots, launched on first use
+_browser = None
+
+# Random generator for candidate locations
+rng = np.random.default_rng()
+
+# Maximum number of candidates validated concurrently
+MAX_CONCURRENT_CHECKS = 20
+
+# All modes are fetched concurrently; the first with no route ends the wait
+TRANSPORT_MODES = ['driving', 'transit', 'bicycling', 'walking']
+
+# Shared pool for the per-mode directions requests of all in-flight candidates
+mode_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHECKS * len(TRANSPORT_MODES))
 
-def generate_random_point_in_radius(center_lat, center_lng, radius_meters):
+# Pool one keep-alive connection per worker thread on the shared client's session,
+# so concurrent requests reuse warm TLS connections instead of opening new ones
+gmaps.session.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_CONCURRENT_CHECKS * len(TRANSPORT_MODES)
+))
+
+
+def generate_candidates(center_lat, center_lng, radius_meters, n):
     """
-    Generate a random point within a given radius of a center point.
+    Generate n random points within a given radius of a center point.
     Uses uniform distribution for more even coverage.
+    Returns an (n, 2) array of (lat, lng) rows.
     """
     # Convert radius from meters to degrees (approximate)
     radius_in_degrees = radius_meters / 111320.0
 
-    # Generate random angle and distance
-    angle = random.uniform(0, 2 * math.pi)
+    # Generate random angles and distances
+    angle = rng.uniform(0, 2 * np.pi, n)
     # Use square root for uniform distribution
-    distance = math.sqrt(random.uniform(0, 1)) * radius_in_degrees
+    distance = np.sqrt(rng.uniform(0, 1, n)) * radius_in_degrees
 
     # Calculate new coordinates
-    delta_lat = distance * math.cos(angle)
-    delta_lng = distance * math.sin(angle) / math.cos(math.radians(center_lat))
+    delta_lat = distance * np.cos(angle)
+    delta_lng = distance * np.sin(angle) / np.cos(np.radians(center_lat))
 
-    new_lat = center_lat + delta_lat
-    new_lng = center_lng + delta_lng
+    return np.column_stack((center_lat + delta_lat, center_lng + delta_lng))
 
-    return new_lat, new_lng
 
+def load_land(geojson_file):
+    """
+    Load the land outline, the shoreline band around it and the Toronto
+    Islands as prepared geometries, so point lookups take microseconds.
+    """
+    with open(geojson_file) as f:
+        features = json.load(f)['features']
 
-def is_on_water(destination):
+    land = unary_union([shape(feature['geometry']) for feature in features])
+    shoreline = land.boundary.buffer(SHORELINE_MARGIN_DEGREES)
+    islands = unary_union([shape(feature['geometry']) for feature in features
+                           if feature['properties']['name'] == 'Toronto Islands'])
+    return prep(land), prep(shoreline), prep(islands)
+
+
+if SHAPELY_AVAILABLE:
+    LAND, SHORELINE, TORONTO_ISLANDS = load_land(LAND_GEOJSON)
+
+
+def classify_terrain(destination):
     """
-    Check if a destination point is on water (lake, ocean, etc.).
-    Returns True if on water, False if on land.
+    Classify a point against the local land outline, without any API call.
+    Returns 'land', 'water', or 'shoreline' if the point is too close to
+    the coast (or shapely is missing) and needs the API water check.
     """
-    try:
-        # Reverse geocode the location
-        result = gmaps.reverse_geocode((destination['lat'], destination['lng']))
+    if not SHAPELY_AVAILABLE:
+        return 'shoreline'
 
-        if not result:
-            # No result means likely in water or invalid location
-            return True
+    point = Point(destination['lng'], destination['lat'])
+    if SHORELINE.contains(point):
+        return 'shoreline'
+    return 'land' if LAND.contains(point) else 'water'
 
-        # Check if the first result indicates water/natural feature
-        first_result = result[0]
-        types = first_result.get('types', [])
 
-        # If result is "natural_feature" or "park" without street address, likely water
-        if 'natural_feature' in types:
-            # Check if there's a street address component
-            address_components = first_result.get('address_components', [])
-            has_street = any('route' in comp.get('types', []) for comp in address_components)
-            if not has_street:
-                return True
+def is_toronto_island(destination):
+    """
+    Check if a point is on the Toronto Islands, which can only be reached by ferry.
+    Returns True if on the islands, False otherwise (or if shapely is missing).
+    """
+    if not SHAPELY_AVAILABLE:
+        return False
+
+    return TORONTO_ISLANDS.contains(Point(destination['lng'], destination['lat']))
 
-        # Check if formatted address is too generic (indicates water)
-        formatted_address = first_result.get('formatted_address', '')
 
-        # If address is just city/province/country without specifics, likely water
-        address_parts = [comp for comp in address_components
-                        if any(t in comp.get('types', [])
-                              for t in ['street_number', 'route'])]
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every Google Maps call.
+    Tokens refill at `rate` per second up to `capacity`. Directions and
+    geocoding calls take 1 token; Distance Matrix calls are billed per
+    element and should take len(origins) * len(destinations).
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n=1):
+        """
+        Block until n tokens are available, then consume them.
+        """
+        if n > self.capacity:
+            raise ValueError(f"Cannot take {n} tokens from a bucket of {self.capacity}")
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+
+                delay = (n - self.tokens) / self.rate
+
+            time.sleep(delay)
+
+
+rate_limiter = TokenBucket(rate=RATE_LIMIT_PER_SECOND, capacity=RATE_LIMIT_BURST)
+
+
+def is_retriable(error):
+    """
+    Check if a Google Maps error is a transient rate limit or server error.
+    Timeouts are not retried: the client raises them only after it has
+    already spent its own retry_timeout retrying 500/503/504 responses.
+    """
+    if isinstance(error, googlemaps.exceptions.HTTPError):
+        return error.status_code in RETRIABLE_HTTP_STATUSES
+    if isinstance(error, googlemaps.exceptions.ApiError):
+        return error.status == 'OVER_QUERY_LIMIT'
+    return False
+
+
+def with_retry(fn):
+    """
+    Retry a Google Maps call with exponential backoff and jitter when it
+    fails with a transient error. Other errors are raised straight away.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_RETRIES):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if not is_retriable(e) or attempt == MAX_RETRIES - 1:
+                    raise
+                delay = min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+                print(f"Warning: {e!r} - retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    return wrapper
+
+
+def snap(location):
+    """
+    Round a location to 4 decimal places (~10m) so that nearby queries
+    share a cache key.
+    """
+    return round(location['lat'], 4), round(location['lng'], 4)
+
+
+def disk_cached(fn):
+    """
+    Cache the result of a Google Maps check on disk, keyed by the function
+    name and its (already snapped) coordinate arguments.
+    Calls that raise are not cached.
+    """
+    if gmaps_cache is None:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args):
+        key = (fn.__name__,) + args
+        value = gmaps_cache.get(key)
+        if value is None:
+            value = fn(*args)
+            gmaps_cache.set(key, value, expire=CACHE_EXPIRE_SECONDS)
+        return value
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_SIZE)
+@disk_cached
+@with_retry
+def _is_on_water_cached(lat, lng):
+    """
+    Reverse geocode a snapped point and decide whether it is on water.
+    """
+    rate_limiter.take(1)
+    result = gmaps.reverse_geocode((lat, lng))
+
+    if not result:
+        # No result means likely in water or invalid location
+        return True
+
+    # Check if the first result indicates water/natural feature
+    first_result = result[0]
+    types = first_result.get('types', [])
+    address_components = first_result.get('address_components', [])
 
-        if not address_parts:
-            # No street-level address components, likely water
+    # If result is "natural_feature" or "park" without street address, likely water
+    if 'natural_feature' in types:
+        # Check if there's a street address component
+        has_street = any('route' in comp.get('types', []) for comp in address_components)
+        if not has_street:
             return True
 
-        return False
+    # If address is just city/province/country without specifics, likely water
+    address_parts = [comp for comp in address_components
+                    if any(t in comp.get('types', [])
+                          for t in ['street_number', 'route'])]
+
+    if not address_parts:
+        # No street-level address components, likely water
+        return True
+
+    return False
+
 
+def is_on_water(destination):
+    """
+    Check if a destination point is on water (lake, ocean, etc.).
+    Returns True if on water, False if on land.
+    """
+    try:
+        on_water = _is_on_water_cached(*snap(destination))
+        VERIFIED[snap(destination)] = on_water
+        return on_water
     except Exception as e:
         print(f"Warning: Could not check if on water: {e}")
         return False
 
 
-def has_ferry_in_route(origin, destination):
+def fetch_all_modes(origin, destination):
     """
-    Check if any route to the destination requires a ferry.
-    Returns True if ferry is required, False otherwise.
+    Fetch directions for all four transport modes concurrently.
+    Returns a dict mapping each mode to its routes (an empty list if the mode
+    is not available), so every route check can share the same responses.
+    Stops as soon as one mode has no route, in which case the dict only
+    holds the modes fetched so far.
     """
     origin_str = f"{origin['lat']},{origin['lng']}"
     dest_str = f"{destination['lat']},{destination['lng']}"
 
-    # Check driving route for ferry
-    try:
-        directions = gmaps.directions(
+    # No departure_time: only route feasibility matters here, and leaving it
+    # out keeps identical queries identical and avoids traffic-aware pricing
+    @with_retry
+    def fetch(mode):
+        rate_limiter.take(1)
+        return gmaps.directions(
             origin_str,
             dest_str,
-            mode='driving',
-            departure_time=datetime.now()
+            mode=mode,
+            alternatives=False
         )
 
-        if directions:
-            # Check all steps in the route for ferry
-            for leg in directions[0]['legs']:
-                for step in leg['steps']:
-                    # Check if travel mode is ferry
-                    if step.get('travel_mode') == 'FERRY':
-                        return True
-                    # Check if instructions mention ferry
-                    if 'ferry' in step.get('html_instructions', '').lower():
-                        return True
+    futures = {mode_executor.submit(fetch, mode): mode for mode in TRANSPORT_MODES}
+    pending = set(futures)
+    routes = {}
 
-        return False
-    except Exception as e:
-        print(f"Warning: Could not check for ferry: {e}")
-        return False
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                routes[futures[future]] = future.result()
 
+            # One missing mode already rules the destination out
+            if not all(routes.values()):
+                break
+    finally:
+        for future in pending:
+            future.cancel()
 
-def check_all_modes_available(origin, destination):
+    return routes
+
+
+def has_ferry_in_route(routes):
+    """
+    Check if the driving route to the destination requires a ferry.
+    Takes the routes returned by fetch_all_modes().
+    Returns True if ferry is required, False otherwise.
+    """
+    directions = routes.get('driving')
+
+    if directions:
+        # Check all steps in the route for ferry
+        for leg in directions[0]['legs']:
+            for step in leg['steps']:
+                # Check if travel mode is ferry
+                if step.get('travel_mode') == 'FERRY':
+                    return True
+                # Check if instructions mention ferry
+                if 'ferry' in step.get('html_instructions', '').lower():
+                    return True
+
+    return False
+
+
+def check_all_modes_available(routes):
     """
     Check if all four transport modes are available for the route.
+    Takes the routes returned by fetch_all_modes().
     Returns True if all modes available, False otherwise.
     """
-    modes = ['driving', 'transit', 'bicycling', 'walking']
-    origin_str = f"{origin['lat']},{origin['lng']}"
-    dest_str = f"{destination['lat']},{destination['lng']}"
+    return all(routes.get(mode) for mode in TRANSPORT_MODES)
 
-    for mode in modes:
-        try:
-            result = gmaps.distance_matrix(
-                origins=origin_str,
-                destinations=dest_str,
-                mode=mode,
-                departure_time=datetime.now()
-            )
 
-            if result['rows'][0]['elements'][0]['status'] != 'OK':
-                return False
+@functools.lru_cache(maxsize=MEMORY_CACHE_SIZE)
+@disk_cached
+def _check_routes_cached(origin_lat, origin_lng, dest_lat, dest_lng):
+    """
+    Fetch directions between a snapped origin/destination pair and derive
+    the route criteria from them.
+    """
+    routes = fetch_all_modes(
+        {'lat': origin_lat, 'lng': origin_lng},
+        {'lat': dest_lat, 'lng': dest_lng}
+    )
+    return has_ferry_in_route(routes), check_all_modes_available(routes)
 
-        except Exception as e:
-            return False
 
-    return True
+def check_routes(origin, destination):
+    """
+    Check the route criteria between origin and destination.
+    Returns a (has_ferry, all_modes_available) tuple.
+    """
+    try:
+        return _check_routes_cached(*snap(origin), *snap(destination))
+    except Exception as e:
+        print(f"Warning: Could not get directions: {e}")
+        return False, False
 
 
-def generate_valid_locations(num_points=100):
+def validate_location(destination, check_water=True):
+    """
+    Check a destination against the app's criteria.
+    Set check_water=False to skip the API water check for points already
+    known to be on land.
+    Returns None if the destination is valid, otherwise the reason it was rejected.
+    """
+    if check_water and is_on_water(destination):
+        return 'On water'
+
+    has_ferry, all_modes_available = check_routes(UNION_STATION, destination)
+
+    if has_ferry:
+        return 'Requires ferry'
+
+    if not all_modes_available:
+        return 'Not all modes available'
+
+    return None
+
+
+async def generate_valid_locations(num_points=100):
     """
     Generate valid random locations following the app's criteria.
+    A fixed pool of candidates is validated concurrently, since every check
+    is an independent round-trip to the Google Maps API, and the first
+    num_points that pass are kept. Returns fewer locations if the pool
+    runs out.
     """
     valid_locations = []
     attempts = 0
-    max_attempts = num_points * 50  # Allow more attempts to find valid points
+    pool_size = num_points * 5  # Candidates to draw valid points from
+
+    # Size the default executor so asyncio.to_thread isn't capped by CPU count
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHECKS)
+    )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+
+    async def validate(destination):
+        # Points clearly in the lake or on the islands are rejected before any API call
+        terrain = classify_terrain(destination)
+        if terrain == 'water':
+            return destination, 'On water'
+
+        # Nearly every ferry route within the radius ends on the islands
+        if is_toronto_island(destination):
+            return destination, 'Requires ferry'
+
+        async with semaphore:
+            rejection = await asyncio.to_thread(
+                validate_location,
+                destination,
+                check_water=(terrain == 'shoreline')
+            )
+        return destination, rejection
 
     print(f"Generating {num_points} valid random locations...")
     print(f"Criteria: Within {MAX_RADIUS_KM}km of Union Station")
@@ -185,37 +497,40 @@ def generate_valid_locations(num_points=100):
     print(f"- No ferry routes")
     print(f"- All 4 transport modes available\n")
 
-    while len(valid_locations) < num_points and attempts < max_attempts:
-        attempts += 1
-
-        # Generate random point
-        dest_lat, dest_lng = generate_random_point_in_radius(
-            UNION_STATION['lat'],
-            UNION_STATION['lng'],
-            MAX_RADIUS_METERS
-        )
-
-        destination = {
-            'lat': dest_lat,
-            'lng': dest_lng
-        }
-
-        # Check criteria
-        if is_on_water(destination):
-            print(f"  Attempt {attempts}: ✗ On water - skipping")
-            continue
-
-        if has_ferry_in_route(UNION_STATION, destination):
-            print(f"  Attempt {attempts}: ✗ Requires ferry - skipping")
-            continue
-
-        if not check_all_modes_available(UNION_STATION, destination):
-            print(f"  Attempt {attempts}: ✗ Not all modes available - skipping")
-            continue
+    # Generate the whole candidate pool up front
+    points = generate_candidates(
+        UNION_STATION['lat'],
+        UNION_STATION['lng'],
+        MAX_RADIUS_METERS,
+        pool_size
+    )
+    tasks = [asyncio.create_task(validate({'lat': float(lat), 'lng': float(lng)}))
+             for lat, lng in points]
 
-        # Valid location!
-        valid_locations.append(destination)
-        print(f"  Attempt {attempts}: ✓ Valid location #{len(valid_locations)} - ({dest_lat:.4f}, {dest_lng:.4f})")
+    try:
+        # Take results as they finish, so one slow check doesn't hold up the rest
+        for next_result in asyncio.as_completed(tasks):
+            destination, rejection = await next_result
+            attempts += 1
+
+            if rejection:
+                print(f"  Attempt {attempts}: ✗ {rejection} - skipping")
+                continue
+
+            # Valid location!
+            valid_locations.append(destination)
+            print(f"  Attempt {attempts}: ✓ Valid location #{len(valid_locations)} - "
+                  f"({destination['lat']:.4f}, {destination['lng']:.4f})")
+
+            if len(valid_locations) == num_points:
+                break
+    finally:
+        # Candidates still waiting for a slot never reach the API
+        for task in tasks:
+            task.cancel()
+
+    if len(valid_locations) < num_points:
+        print("\n⚠️  Candidate pool exhausted, returning a partial batch")
 
     print(f"\n✓ Generated {len(valid_locations)} valid locations in {attempts} attempts")
     return valid_locations
@@ -251,18 +566,8 @@ def create_map_with_locations(locations, filename='test_locations_map.html'):
         popup=f'{MAX_RADIUS_KM}km radius'
     ).add_to(m)
 
-    # Add all generated locations
-    for i, loc in enumerate(locations, 1):
-        folium.CircleMarker(
-            location=[loc['lat'], loc['lng']],
-            radius=5,
-            popup=f'Location #{i}<br>({loc["lat"]:.4f}, {loc["lng"]:.4f})',
-            color='green',
-            fill=True,
-            fillColor='green',
-            fillOpacity=0.7,
-            tooltip=f'#{i}'
-        ).add_to(m)
+    # Add all generated locations as a single clustered JS array
+    FastMarkerCluster([[loc['lat'], loc['lng']] for loc in locations]).add_to(m)
 
     # Save map
     m.save(filename)
@@ -308,13 +613,13 @@ def save_map_as_png_matplotlib(locations, png_file='test_locations_map.png'):
     )
     ax.add_patch(circle)
 
-    # Plot all locations
-    for i, loc in enumerate(locations, 1):
-        ax.plot(loc['lng'], loc['lat'], 'go', markersize=8, alpha=0.6, zorder=3)
-        # Add number labels for first 20 points
-        if i <= 20:
-            ax.annotate(str(i), (loc['lng'], loc['lat']),
-                       fontsize=6, ha='center', va='center')
+    # Plot all locations as a single collection
+    ax.scatter(lngs, lats, s=64, c='green', alpha=0.6, zorder=3)
+
+    # Add number labels for first 20 points
+    for i, loc in enumerate(locations[:20], 1):
+        ax.annotate(str(i), (loc['lng'], loc['lat']),
+                   fontsize=6, ha='center', va='center')
 
     ax.set_xlabel('Longitude', fontsize=12)
     ax.set_ylabel('Latitude', fontsize=12)
@@ -343,49 +648,64 @@ def save_map_as_png_matplotlib(locations, png_file='test_locations_map.png'):
     return True
 
 
-def save_map_as_png_selenium(html_file, png_file='test_locations_map_selenium.png'):
+def get_browser():
+    """
+    Launch headless Chromium on first use and reuse it for later screenshots.
+    """
+    global _browser
+    if _browser is None:
+        playwright = sync_playwright().start()
+        try:
+            _browser = playwright.chromium.launch()
+        except Exception:
+            # Don't leave the driver running if Chromium can't start
+            playwright.stop()
+            raise
+        # Registered last so it runs first: close the browser, then stop Playwright
+        atexit.register(playwright.stop)
+        atexit.register(_browser.close)
+    return _browser
+
+
+def save_map_as_png_playwright(html_file, png_file='test_locations_map_playwright.png'):
     """
-    Convert the HTML map to PNG using Selenium (if available).
+    Convert the HTML map to PNG using Playwright (if available).
     """
-    if not SELENIUM_AVAILABLE:
-        print("✗ Selenium not available, skipping HTML to PNG conversion")
+    if not PLAYWRIGHT_AVAILABLE:
+        print("✗ Playwright not available, skipping HTML to PNG conversion")
         return False
 
-    print(f"\nConverting HTML map to PNG with Selenium...")
+    print("\nConverting HTML map to PNG with Playwright...")
 
     try:
-        # Set up Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-
-        # Create driver
-        driver = webdriver.Chrome(options=chrome_options)
-
-        # Load the HTML file
-        driver.get(f'file://{os.path.abspath(html_file)}')
+        page = get_browser().new_page(viewport={'width': 1920, 'height': 1080})
+        try:
+            # Load the HTML file
+            page.goto(f'file://{os.path.abspath(html_file)}')
 
-        # Wait for map to load
-        time.sleep(3)
+            # Wait for the map tiles to finish loading
+            page.wait_for_load_state('networkidle')
 
-        # Take screenshot
-        driver.save_screenshot(png_file)
-        driver.quit()
+            # Take screenshot
+            page.screenshot(path=png_file)
+        finally:
+            page.close()
 
-        print(f"✓ Selenium PNG saved to {png_file}")
+        print(f"✓ Playwright PNG saved to {png_file}")
         return True
 
     except Exception as e:
-        print(f"✗ Error saving PNG with Selenium: {e}")
-        print("  Note: Make sure Chrome and chromedriver are installed")
+        print(f"✗ Error saving PNG with Playwright: {e}")
+        print("  Note: Make sure Chromium is installed (playwright install chromium)")
         return False
 
 
 def verify_no_water_points(locations):
     """
     Verify that none of the generated points are on water.
+    Reuses the is_on_water() results recorded during generation, and only
+    calls the API for locations it never checked (e.g. points the land
+    outline placed inland).
     """
     print("\n" + "="*80)
     print("VERIFICATION: Checking all points are not on water...")
@@ -393,7 +713,11 @@ def verify_no_water_points(locations):
 
     water_points = []
     for i, loc in enumerate(locations, 1):
-        if is_on_water(loc):
+        on_water = VERIFIED.get(snap(loc))
+        if on_water is None:
+            on_water = is_on_water(loc)
+
+        if on_water:
             water_points.append((i, loc))
             print(f"✗ Location #{i} is on water: ({loc['lat']:.4f}, {loc['lng']:.4f})")
         else:
@@ -421,7 +745,7 @@ if __name__ == '__main__':
     print("="*80)
 
     # Generate valid locations
-    locations = generate_valid_locations(num_points=num_points)
+    locations = asyncio.run(generate_valid_locations(num_points=num_points))
 
     if not locations:
         print("\n✗ Failed to generate any valid locations!")
@@ -433,8 +757,8 @@ if __name__ == '__main__':
     # Save as PNG (using matplotlib - more reliable)
     save_map_as_png_matplotlib(locations, 'test_locations_map.png')
 
-    # Optionally save HTML map as PNG with Selenium (if available)
-    save_map_as_png_selenium(html_file, 'test_locations_map_interactive.png')
+    # Optionally save HTML map as PNG with Playwright (if available)
+    save_map_as_png_playwright(html_file, 'test_locations_map_interactive.png')
 
     # Verify no water points
     verify_no_water_points(locations)